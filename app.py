@@ -1,17 +1,90 @@
 from flask import Flask, render_template, request
 import requests
-import utm
 import numpy as np
-from bs4 import BeautifulSoup
-import folium
-from scipy.interpolate import RBFInterpolator
-import re
+from lxml import html
+import json
+from html import escape as html_escape
+from functools import lru_cache
+import logging
 
 app = Flask(__name__)
 
+# Debug/progress messages of the request path; silent unless the level is lowered
+logger = logging.getLogger(__name__)
+
+# Calibration reference points
+GIVEN_EASTING = np.array([477504.6975, 482977.07875, 487741.8536])
+GIVEN_NORTHING = np.array([980922.813, 992734.94275, 993586.1784])
+EASTING_CALIB_REQ = np.array([90.6484, 92.6484, 94.6484])
+NORTHING_CALIB_REQ = np.array([204.2779, 210.2779, 208.2779])
+
+# Three points in 2D fix a unique affine map a*easting + b*northing + c, which is exactly what the
+# previous thin-plate RBF (with its degree-1 polynomial term) reduced to. Solve it once at import;
+# each column holds the (a, b, c) coefficients for the easting and northing calibration respectively.
+CALIB_POINTS = np.column_stack((GIVEN_EASTING, GIVEN_NORTHING, np.ones(3)))
+CALIB_COEFS = np.linalg.solve(CALIB_POINTS, np.column_stack((EASTING_CALIB_REQ, NORTHING_CALIB_REQ)))
+
+# Shared HTTP session so repeat lookups reuse the keep-alive connection to addisland.gov.et
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10))
+HTTP_SESSION.headers.update({"User-Agent": "addisland_locator/1.0"})
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+# WGS84 ellipsoid and UTM scale factor (same values as utm.to_latlon), computed once at import
+UTM_ZONE = 37  # Addis Ababa
+UTM_K0 = 0.9996
+UTM_E = 0.00669438
+UTM_E_P2 = UTM_E / (1 - UTM_E)
+UTM_R = 6378137
+
+_sqrt_e = np.sqrt(1 - UTM_E)
+_e = (1 - _sqrt_e) / (1 + _sqrt_e)
+
+UTM_M1 = 1 - UTM_E / 4 - 3 * UTM_E ** 2 / 64 - 5 * UTM_E ** 3 / 256
+UTM_P2 = 3 / 2 * _e - 27 / 32 * _e ** 3 + 269 / 512 * _e ** 5
+UTM_P3 = 21 / 16 * _e ** 2 - 55 / 32 * _e ** 4
+UTM_P4 = 151 / 96 * _e ** 3 - 417 / 128 * _e ** 5
+UTM_P5 = 1097 / 512 * _e ** 4
+
+# ESRI World Imagery (Best Alternative to Google Satellite)
+ESRI_WORLD_IMAGERY_TILES = ("https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}", "Tiles © Esri &mdash; Source: Esri, Maxar, Earthstar Geographics")
+
+MAP_TILES = ESRI_WORLD_IMAGERY_TILES
+
+# Standalone Leaflet page for the plot, written directly instead of going through Folium/Jinja
+MAP_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta http-equiv="content-type" content="text/html; charset=UTF-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no" />
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css"/>
+    <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+    <style>
+        html, body {{ width: 100%; height: 100%; margin: 0; padding: 0; }}
+        #map {{ position: absolute; top: 0; bottom: 0; right: 0; left: 0; }}
+        .leaflet-container {{ font-size: 1rem; }}
+    </style>
+</head>
+<body>
+    <div id="map"></div>
+    <script>
+        var map = L.map("map", {{center: [{center_lat}, {center_lon}], zoom: {zoom_start}}});
+        L.tileLayer({tiles_url}, {{maxZoom: {max_zoom}, maxNativeZoom: {max_zoom}, attribution: {tiles_attr}}}).addTo(map);
+        {markers_js}
+        {polyline_js}
+    </script>
+</body>
+</html>"""
+
+MAP_IFRAME_TEMPLATE = (
+    '<div style="width:100%;"><div style="position:relative;width:100%;height:0;padding-bottom:60%;">'
+    '<iframe srcdoc="{srcdoc}" style="position:absolute;width:100%;height:100%;left:0;top:0;border:none !important;" '
+    'allowfullscreen webkitallowfullscreen mozallowfullscreen></iframe></div></div>'
+)
+
 def generate_precalibrated_matrix(easting_northing_matrix):
     """
-    Applies calibration adjustments to the easting and northing coordinates using interpolation.
+    Applies calibration adjustments to the easting and northing coordinates using an affine interpolation.
 
     Args:
         easting_northing_matrix (list of lists or numpy array): 
@@ -21,36 +94,17 @@ def generate_precalibrated_matrix(easting_northing_matrix):
         numpy.ndarray: Precalibrated easting and northing matrix.
     """
 
-    # Convert input to numpy array
-    easting_northing_matrix = np.array(easting_northing_matrix)
+    # Convert input to numpy array (no copy when a float64 array is passed in)
+    easting_northing_matrix = np.asarray(easting_northing_matrix, dtype=np.float64)
     
     if easting_northing_matrix.shape[1] != 2:
         raise ValueError("Input matrix must have exactly two columns: [easting, northing]")
 
-    # Extract eastings and northings
-    eastings = easting_northing_matrix[:, 0]
-    northings = easting_northing_matrix[:, 1]
-
-    # Calibration reference points
-    given_easting = np.array([477504.6975, 482977.07875, 487741.8536])
-    given_northing = np.array([980922.813, 992734.94275, 993586.1784])
-    easting_calib_req = np.array([90.6484, 92.6484, 94.6484])
-    northing_calib_req = np.array([204.2779, 210.2779, 208.2779])
-
-    # Compute mean values for interpolation
-    this_mean_easting = np.mean(eastings)
-    this_mean_northing = np.mean(northings)
-
-    # Combine given_easting and given_northing as input data points
-    points = np.column_stack((given_easting, given_northing))
-
-    # Use RBFInterpolator for interpolation & extrapolation
-    F_easting_calib_req = RBFInterpolator(points, easting_calib_req, smoothing=0)
-    F_northing_calib_req = RBFInterpolator(points, northing_calib_req, smoothing=0)
+    # Compute mean values for interpolation (one pass over both columns)
+    this_mean_easting, this_mean_northing = easting_northing_matrix.mean(axis=0)
 
     # Compute calibration values
-    calib_value_eastings = F_easting_calib_req([[this_mean_easting, this_mean_northing]])[0]
-    calib_value_northings = F_northing_calib_req([[this_mean_easting, this_mean_northing]])[0]
+    calib_value_eastings, calib_value_northings = np.array([this_mean_easting, this_mean_northing, 1.0]) @ CALIB_COEFS
 
 
     # Print computed calibration values
@@ -58,90 +112,258 @@ def generate_precalibrated_matrix(easting_northing_matrix):
     #print(f"Calibration Value for Eastings: {calib_value_eastings}")
     #print(f"Calibration Value for Northings: {calib_value_northings}")
 
-    # Apply calibration
-    precalib_eastings = eastings + calib_value_eastings
-    precalib_northings = northings + calib_value_northings
+    # Apply calibration to both columns with one broadcast add and return the precalibrated matrix
+    return easting_northing_matrix + np.array([calib_value_eastings, calib_value_northings])
 
-    # Return the precalibrated matrix
-    return np.column_stack((precalib_eastings, precalib_northings))
+class CoordinatesTableComplete(Exception):
+    """Raised by CoordinatesTableTarget to stop parsing once the coordinates table is closed."""
 
-def extract_coordinates_from_addisland(title_deed_number):
+
+class CoordinatesTableTarget:
+    """
+    lxml parser target that streams through a certificate page and keeps only the coordinates table:
+    the outermost <table> that contains a <span> with the "Cordnates/" caption. Caption spans outside
+    any table (e.g. a legend before it) are ignored, as in //table//span.
+
+    Only the rows of the current top-level table are held in memory; they are discarded when that
+    table closes without the caption, and parsing stops (CoordinatesTableComplete) once the
+    coordinates table closes.
+    """
+
+    def __init__(self):
+        self.table_depth = 0
+        self.found_caption = False
+        self.rows = []        # [td, ...] text buffers of the rows of the current top-level table
+        self.open_rows = []   # td buffers of the <tr> elements currently open
+        self.open_cells = []  # text buffers of the <td> elements currently open
+        self.open_spans = []  # text buffers of the <span> elements currently open
+
+    def start(self, tag, attrib):
+        if tag == "table":
+            self.table_depth += 1
+        elif self.table_depth == 0:
+            # Outside any table: no rows, cells or caption spans to track
+            return
+        elif tag == "tr":
+            cells = []
+            self.rows.append(cells)
+            self.open_rows.append(cells)
+        elif tag == "td":
+            # Register the cell with every open row, like .//td, in document order
+            text = []
+            for cells in self.open_rows:
+                cells.append(text)
+            self.open_cells.append(text)
+        elif tag == "span":
+            self.open_spans.append([])
+
+    def end(self, tag):
+        if self.table_depth == 0:
+            return
+        if tag == "table":
+            self.table_depth -= 1
+            if self.table_depth == 0:
+                if self.found_caption:
+                    raise CoordinatesTableComplete()
+                self.rows = []
+        elif tag == "tr" and self.open_rows:
+            self.open_rows.pop()
+        elif tag == "td" and self.open_cells:
+            self.open_cells.pop()
+        elif tag == "span" and self.open_spans:
+            if "Cordnates/" in "".join(self.open_spans.pop()):
+                self.found_caption = True
+
+    def data(self, data):
+        # Text belongs to every enclosing cell/span, like text_content()
+        for text in self.open_cells:
+            text.append(data)
+        for text in self.open_spans:
+            text.append(data)
+
+    def close(self):
+        pass
+
+    def cell_texts(self):
+        """
+        Returns the stripped cell texts of the two-cell rows after the header row, flattened as
+        [x0, y0, x1, y1, ...], or None when no coordinates table was found.
+        """
+        if not self.found_caption:
+            return None
+
+        return ["".join(text).strip() for cells in self.rows[1:] if len(cells) == 2 for text in cells]
+
+
+def stream_coordinate_cells(chunks):
+    """
+    Feeds the HTML byte chunks to a CoordinatesTableTarget, stopping as soon as the coordinates
+    table is complete, and returns its cell texts (None when the table is missing). Chunks after
+    the table are left unread in the iterator.
+    """
+    target = CoordinatesTableTarget()
+    parser = html.HTMLParser(target=target)
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+        parser.close()
+    except CoordinatesTableComplete:
+        pass
+
+    return target.cell_texts()
+
+
+def scrape_coordinates_from_addisland(title_deed_number):
     """
     Scrapes the Addis Land website and extracts the Easting/Northing coordinates.
     """
 
     url = f"https://www.addisland.gov.et/en-us/certificate/{title_deed_number}"
-    print(f"🔍 Checking URL: {url}")  # Debug print
+    logger.debug("🔍 Checking URL: %s", url)
 
     try:
-        response = requests.get(url)
+        # Stream the body so it is parsed as it arrives instead of being held as one string
+        response = HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT, stream=True)
         response.raise_for_status()  # Will raise an error for bad responses (4xx, 5xx)
-        print("✅ Successfully fetched HTML")
-        #print(response.text[:1000])  # Print the first 1000 characters of the page
+        logger.debug("✅ Successfully connected")
     except requests.exceptions.RequestException as e:
-        print(f"❌ Failed to fetch HTML: {e}")
+        if e.response is not None:
+            e.response.close()
+        logger.warning("❌ Failed to fetch HTML: %s", e)
         return None, "❌ Server Problem: Failed to get response. Please retry later."
 
 
     try:
-        soup = BeautifulSoup(response.text, "html.parser")
+        with response:
+            chunks = response.iter_content(chunk_size=16384)
+            cells = stream_coordinate_cells(chunks)
 
-        # Save the prettified HTML to a text file with utf-8 encoding
-        #with open('temp_html_output.txt', 'w', encoding='utf-8') as file:
-        #    file.write(soup.prettify())
+            # Read and discard the rest of the body so the keep-alive connection goes back to the pool
+            for _ in chunks:
+                pass
 
-        tables = soup.find_all("table")
+        if cells is None:
+            raise ValueError("Coordinates table not found")
+        logger.debug("✅ Found the correct table!")
 
-        selected_table = None
- 
-        print(f"🔍 Found {len(tables)} tables.")
-        for i, table in enumerate(tables):
-            spans = table.find_all("span")
-            span_texts = [span.get_text(strip=True) for span in spans]
-            #print(f"📌 Table {i}: {span_texts}")  # Print table contents
+        # Cells of every two-cell row after the header row, as [easting, northing] rows
+        cell_texts = np.array(cells, dtype=str).reshape(-1, 2)
 
-            if any("Cordnates/" in text for text in span_texts):
-                print("✅ Found the correct table!")
-                selected_table = table
-                break
-
-        rows = selected_table.find_all("tr")
         coordinate_data = []
 
-        for row in rows[1:]:  # Skip header row
-            cols = row.find_all("td")
-            if len(cols) == 2:
-                x = cols[0].get_text(strip=True)
-                y = cols[1].get_text(strip=True)
-
-                # Ensure extracted values are numeric before conversion
-                if x.replace(".", "", 1).isdigit() and y.replace(".", "", 1).isdigit():
-                    coordinate_data.append([float(x), float(y)])
-                else:
-                    pass
-                    #print(f"⚠️ Skipping non-numeric row: {x}, {y}")
-        
-        ## Regular Expression to Find the PDF Export Link
-        #pdf_pattern = re.compile(r"https:\/\/www\.addisland\.gov\.et\/Reserved\.ReportViewerWebControl\.axd\?[^\"\']*Format=PDF")
-
-        ## Extract All Matching PDF Links
-        ## Find the link (using regex if necessary)
-        #save_as_pdf_link = soup.find('a', href=pdf_pattern)
-
-        #print(f"📌 Found Save AS PDF Link {i}: {save_as_pdf_link}")
-
+        if cell_texts.size:
+            # Ensure extracted values are numeric before conversion (whole rows are dropped otherwise)
+            is_numeric = np.char.isdigit(np.char.replace(cell_texts, ".", "", count=1)).all(axis=1)
+            coordinate_data = cell_texts[is_numeric].astype(np.float64).tolist()
 
         if coordinate_data:
             return {'easting_northing_matrix':coordinate_data,'addisland_url':url}, 'Success'
         else:
-            print("❌ No valid coordinates found")
+            logger.info("❌ No valid coordinates found")
             return None, "❌ No valid coordinates found."
 
+    except requests.exceptions.RequestException as e:
+        logger.warning("❌ Failed to fetch HTML: %s", e)
+        return None, "❌ Server Problem: Failed to get response. Please retry later."
+
     except Exception as e:
-        print(f"Error fetching data: {e}")
+        logger.warning("Error fetching data: %s", e)
         return None, "❌ Invalid Title Deed Number: Please enter correct title deed number."
 
 
+@lru_cache(maxsize=1024)
+def fetch_coordinates_from_addisland(title_deed_number):
+    """
+    Cached scrape of a title deed. Returns the coordinates as a tuple of (easting, northing)
+    tuples together with the certificate URL, and raises LookupError with the reply message
+    on failure so that failed lookups are not cached and get retried.
+    """
+    out_dict, reply_msg = scrape_coordinates_from_addisland(title_deed_number)
+    if not out_dict:
+        raise LookupError(reply_msg)
+
+    return tuple(map(tuple, out_dict['easting_northing_matrix'])), out_dict['addisland_url']
+
+
+def extract_coordinates_from_addisland(title_deed_number):
+    """
+    Extracts the Easting/Northing coordinates of a title deed, scraping the Addis Land
+    website only the first time a deed is seen (certificates do not change).
+    """
+    try:
+        easting_northing_matrix, addisland_url = fetch_coordinates_from_addisland(title_deed_number)
+    except LookupError as e:
+        return None, str(e)
+
+    return {'easting_northing_matrix':[list(row) for row in easting_northing_matrix],'addisland_url':addisland_url}, 'Success'
+
+
+def utm_to_lats_lons(eastings, northings, zone=UTM_ZONE, northern=True):
+    """
+    Converts arrays of UTM Eastings/Northings to Lat/Lon in one vectorized pass.
+
+    Args:
+        eastings (numpy.ndarray): Easting values of the UTM coordinates.
+        northings (numpy.ndarray): Northing values of the UTM coordinates.
+        zone (int): UTM zone number (default 37 for Addis Ababa).
+        northern (bool): True for the northern hemisphere.
+
+    Returns:
+        tuple of numpy.ndarray: Latitudes and longitudes in degrees.
+    """
+
+    x = np.asarray(eastings) - 500000
+    y = np.asarray(northings)
+    if not northern:
+        y = y - 10000000
+
+    # Footpoint latitude
+    mu = y / UTM_K0 / (UTM_R * UTM_M1)
+    p_rad = (mu +
+             UTM_P2 * np.sin(2 * mu) +
+             UTM_P3 * np.sin(4 * mu) +
+             UTM_P4 * np.sin(6 * mu) +
+             UTM_P5 * np.sin(8 * mu))
+
+    p_sin = np.sin(p_rad)
+    p_sin2 = p_sin * p_sin
+    p_cos = np.cos(p_rad)
+
+    p_tan = p_sin / p_cos
+    p_tan2 = p_tan * p_tan
+    p_tan4 = p_tan2 * p_tan2
+
+    ep_sin = 1 - UTM_E * p_sin2
+    n = UTM_R / np.sqrt(ep_sin)
+    r = (1 - UTM_E) / ep_sin
+
+    c = UTM_E_P2 * p_cos ** 2
+    c2 = c * c
+
+    d = x / (n * UTM_K0)
+    d2 = d * d
+    d3 = d2 * d
+    d4 = d3 * d
+    d5 = d4 * d
+    d6 = d5 * d
+
+    lats = p_rad - (p_tan / r) * (
+        d2 / 2 -
+        d4 / 24 * (5 + 3 * p_tan2 + 10 * c - 4 * c2 - 9 * UTM_E_P2) +
+        d6 / 720 * (61 + 90 * p_tan2 + 298 * c + 45 * p_tan4 - 252 * UTM_E_P2 - 3 * c2))
+
+    lons = (d -
+            d3 / 6 * (1 + 2 * p_tan2 + c) +
+            d5 / 120 * (5 - 2 * c + 28 * p_tan2 - 3 * c2 + 8 * UTM_E_P2 + 24 * p_tan4)) / p_cos
+
+    # Shift by the central meridian of the zone and wrap to [-180, 180)
+    lons = lons + np.radians((zone - 1) * 6 - 180 + 3)
+    lons = (lons + np.pi) % (2 * np.pi) - np.pi
+
+    return np.degrees(lats), np.degrees(lons)
+
+
 def convert_eastings_northings_to_lats_lons(easting_northing_matrix):
     """
     Converts Easting/Northing to Lat/Lon, 
@@ -150,50 +372,54 @@ def convert_eastings_northings_to_lats_lons(easting_northing_matrix):
         return None
     
     # Determine UTM zone (default 37 for Addis Ababa)
-    zone = 37
-    computed_lats, computed_lons = [], []
-    
-    eastings = np.array(easting_northing_matrix)[:, 0]
-    northings = np.array(easting_northing_matrix)[:, 1]
+    zone = UTM_ZONE
+
+    # Convert once and pass the array on, so it is not copied again downstream
+    easting_northing_matrix = np.asarray(easting_northing_matrix, dtype=np.float64)
 
     # Calibration values for correcting positions
     precalib_easting_northing_matrix = generate_precalibrated_matrix(easting_northing_matrix)
-    
-    for easting, northing in precalib_easting_northing_matrix:
-        lat, lon = utm.to_latlon(easting, northing, zone, northern=True)
-        computed_lats.append(lat)
-        computed_lons.append(lon)
+
+    computed_lats, computed_lons = utm_to_lats_lons(precalib_easting_northing_matrix[:, 0], precalib_easting_northing_matrix[:, 1], zone, northern=True)
 
     # Close the plot shape
-    computed_lats.append(computed_lats[0])
-    computed_lons.append(computed_lons[0])
+    computed_lats = np.r_[computed_lats, computed_lats[:1]]
+    computed_lons = np.r_[computed_lons, computed_lons[:1]]
 
     return computed_lats,computed_lons
 
 
 def plot_lats_lons_on_map(computed_lats,computed_lons, title="Land Plot"):
     """
-    Takes in Lat/Lon, embeds the Folium map.
+    Takes in Lat/Lon, embeds the Leaflet map.
     """
     
     center_lat, center_lon = np.mean(computed_lats), np.mean(computed_lons)
-    # ESRI World Imagery (Best Alternative to Google Satellite)
-    map_ESRI_World_Imagery = folium.Map(location=[center_lat, center_lon], zoom_start=18, max_zoom=109, tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}", attr="Tiles © Esri &mdash; Source: Esri, Maxar, Earthstar Geographics")
-    # Stamen Terrain (For a Topographic View)
-    map_Stamen_Terrain = folium.Map(location=[center_lat, center_lon], zoom_start=18, max_zoom=109, tiles="https://stamen-tiles.a.ssl.fastly.net/terrain/{z}/{x}/{y}.jpg", attr="Map tiles by Stamen Design, under CC BY 3.0. Data by OpenStreetMap, under ODbL.")
-
-    map_ = map_ESRI_World_Imagery
-    #map_ = map_Stamen_Terrain
+    tiles_url, tiles_attr = MAP_TILES
 
-    
     # Add markers
-    for lat, lon in zip(computed_lats[:-1], computed_lons[:-1]):
-        folium.Marker([lat, lon], popup="Point").add_to(map_)
+    markers_js = "\n        ".join(f'L.marker([{float(lat)}, {float(lon)}]).bindPopup("Point").addTo(map);'
+                                   for lat, lon in zip(computed_lats[:-1], computed_lons[:-1]))
 
     # Draw boundary
-    folium.PolyLine(list(zip(computed_lats, computed_lons)), color="blue", weight=2.5, opacity=1).add_to(map_)
+    polyline_js = f'L.polyline({json.dumps([[float(lat), float(lon)] for lat, lon in zip(computed_lats, computed_lons)])}, {{color: "blue", weight: 2.5, opacity: 1}}).addTo(map);'
+
+    map_page = MAP_PAGE_TEMPLATE.format(center_lat=float(center_lat), center_lon=float(center_lon), zoom_start=18, max_zoom=109,
+                                        tiles_url=json.dumps(tiles_url), tiles_attr=json.dumps(tiles_attr),
+                                        markers_js=markers_js, polyline_js=polyline_js)
 
-    return map_._repr_html_()  # Return HTML for embedding
+    # Embed the standalone page in an iframe so the map keeps its own sizing
+    return MAP_IFRAME_TEMPLATE.format(srcdoc=html_escape(map_page))  # Return HTML for embedding
+
+
+@lru_cache(maxsize=256)
+def render_map_html(lat_lon_pairs):
+    """
+    Cached wrapper around plot_lats_lons_on_map, keyed on a tuple of (lat, lon) pairs,
+    so repeat views of the same plot skip rebuilding the map HTML.
+    """
+    computed_lats, computed_lons = zip(*lat_lon_pairs)
+    return plot_lats_lons_on_map(list(computed_lats), list(computed_lons))
 
 
 @app.route("/", methods=["GET", "POST"])  # Ensure POST is allowed
@@ -220,8 +446,10 @@ def index():
                     google_map_href = f"https://www.google.com/maps?q={center_lat},{center_lon}"
                     addisland_href = out_dict['addisland_url']
 
-                    # Create table rows
-                    table_rows = "".join(f"<tr><td>{lat:.8f}</td><td>{lon:.8f}</td></tr>" for lat, lon in zip(computed_lats, computed_lons))
+                    # Create table rows (floats formatted by NumPy in one call per column)
+                    lat_strs = np.char.mod("%0.8f", computed_lats)
+                    lon_strs = np.char.mod("%0.8f", computed_lons)
+                    table_rows = "".join("<tr><td>%s</td><td>%s</td></tr>" % (lat, lon) for lat, lon in zip(lat_strs, lon_strs))
 
                     # Construct the complete HTML
                     validity_html = f"""
@@ -236,10 +464,10 @@ def index():
                         </table>
                     """
 
-                    map_html = plot_lats_lons_on_map(computed_lats,computed_lons, title=title_deed_number)
+                    map_html = render_map_html(tuple(zip(computed_lats.tolist(), computed_lons.tolist())))
                     
                     #map_html = convert_and_plot(easting_northing_matrix, title=title_deed_number)
-                    print("✅ Plot the coordinates over Folium map!")
+                    logger.debug("✅ Plot the coordinates over Leaflet map!")
                 else:
                     #map_html = "<p style='color:red;'>Failed to retrieve coordinates.</p>"
                     validity_html = "<p style='color:red;'>❌ Invalid Input: Failed to retrieve coordinates.</p>"
@@ -249,4 +477,5 @@ def index():
     return render_template("index.html", map_html=map_html, validity_html = validity_html, title_deed_number=title_deed_number, google_map_href = google_map_href, addisland_href = addisland_href)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     app.run(debug=True)
@@ -0,0 +1,6 @@
+# Gunicorn settings, picked up automatically from the working directory (gunicorn wsgi:app)
+
+# Threaded workers: while one request waits on addisland.gov.et (requests releases the GIL
+# during socket I/O), the other threads of the same worker keep serving users.
+worker_class = "gthread"
+threads = 8  # Keep <= the pool_maxsize of HTTP_SESSION in app.py